@@ -1,5 +1,8 @@
 from __future__ import annotations
-from pydantic_ai import Agent, RunContext
+import asyncio
+from dataclasses import dataclass
+
+from pydantic_ai import Agent, RunContext, Tool
 
 from .services.filesystem import FileSandbox
 from .services.calculator import CalculatorService
@@ -34,100 +37,114 @@ INSTRUCTIONS = (
     "• Prefer the safest tool that matches the request; explain limits if a task isn't possible.\n"
 )
 
+@dataclass(slots=True)
+class Deps:
+    """Services the tools reach through ``ctx.deps``."""
+    fs: FileSandbox
+    calc: CalculatorService
+
+# Tools are plain module-level functions so their schemas are introspected
+# once at import; filesystem tools run in worker threads so independent tool
+# calls from one model turn don't serialize on blocking disk I/O.
+
+async def calculator(ctx: RunContext[Deps], expression: str) -> float:
+    return ctx.deps.calc.evaluate(expression)
+
+async def list_dir(ctx: RunContext[Deps], path: str = ".", tree: bool = True, max_depth: int = 2) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.list_dir, path=path, tree=tree, max_depth=max_depth)
+
+async def read_file(ctx: RunContext[Deps], path: str, max_bytes: int = 200_000) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.read_file, path=path, max_bytes=max_bytes)
+
+async def write_file(ctx: RunContext[Deps], path: str, content: str) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.write_file, path=path, content=content)
+
+async def append_file(ctx: RunContext[Deps], path: str, content: str) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.append_file, path=path, content=content)
+
+async def copy_file(ctx: RunContext[Deps], src: str, dst: str, overwrite: bool = False) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.copy_file, src=src, dst=dst, overwrite=overwrite)
+
+async def move_file(ctx: RunContext[Deps], src: str, dst: str, overwrite: bool = False) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.move_file, src=src, dst=dst, overwrite=overwrite)
+
+async def create_file(ctx: RunContext[Deps], path: str, content: str = "") -> str:
+    return await asyncio.to_thread(ctx.deps.fs.create_file, path=path, content=content)
+
+async def create_files_sequence(
+    ctx: RunContext[Deps], prefix: str, suffix: str, start: int, end: int, zero_pad: int = 0, content: str = ""
+) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.create_files_sequence, prefix=prefix, suffix=suffix, start=start, end=end, zero_pad=zero_pad, content=content)
+
+async def rename_file(ctx: RunContext[Deps], old_path: str, new_path: str) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.rename_file, old_path=old_path, new_path=new_path)
+
+async def rename_files_sequence(
+    ctx: RunContext[Deps],
+    old_prefix: str, old_suffix: str,
+    new_prefix: str, new_suffix: str,
+    start: int, end: int, zero_pad: int = 0,
+    skip_missing: bool = True, overwrite: bool = False
+) -> str:
+    return await asyncio.to_thread(
+        ctx.deps.fs.rename_files_sequence,
+        old_prefix=old_prefix, old_suffix=old_suffix,
+        new_prefix=new_prefix, new_suffix=new_suffix,
+        start=start, end=end, zero_pad=zero_pad,
+        skip_missing=skip_missing, overwrite=overwrite
+    )
+
+async def delete_file(ctx: RunContext[Deps], path: str) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.delete_file, path=path)
+
+async def delete_glob(ctx: RunContext[Deps], pattern: str) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.delete_glob, pattern=pattern)
+
+async def create_folder(ctx: RunContext[Deps], path: str, exist_ok: bool = True) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.create_folder, path=path, exist_ok=exist_ok)
+
+async def create_folders_sequence(
+    ctx: RunContext[Deps], prefix: str, suffix: str = "", start: int = 1, end: int = 1, zero_pad: int = 0
+) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.create_folders_sequence, prefix=prefix, suffix=suffix, start=start, end=end, zero_pad=zero_pad)
+
+async def delete_folder(ctx: RunContext[Deps], path: str, recursive: bool = False) -> str:
+    return await asyncio.to_thread(ctx.deps.fs.delete_folder, path=path, recursive=recursive)
+
+async def bulk_rename_regex(
+    ctx: RunContext[Deps], base_path: str, pattern: str, replacement: str,
+    include_subdirs: bool = True, test_only: bool = False
+) -> str:
+    return await asyncio.to_thread(
+        ctx.deps.fs.bulk_rename_regex,
+        base_path=base_path, pattern=pattern, replacement=replacement,
+        include_subdirs=include_subdirs, test_only=test_only
+    )
+
+# Read-only tools may overlap within one model turn; anything that changes the
+# sandbox is a sequential barrier so dependent calls keep the emitted order.
+_READ_ONLY = (calculator, list_dir, read_file)
+_MUTATING = (
+    write_file,
+    append_file,
+    copy_file,
+    move_file,
+    create_file,
+    create_files_sequence,
+    rename_file,
+    rename_files_sequence,
+    delete_file,
+    delete_glob,
+    create_folder,
+    create_folders_sequence,
+    delete_folder,
+    bulk_rename_regex,
+)
+TOOLS = tuple(Tool(fn) for fn in _READ_ONLY) + tuple(Tool(fn, sequential=True) for fn in _MUTATING)
+
 class AgentFactory:
-    """Creates an Agent and binds tools from our services."""
+    """Creates an Agent wired to the prebuilt TOOLS."""
 
     @staticmethod
-    def build(model, fs: FileSandbox, calc: CalculatorService) -> Agent:
-        agent = Agent(model, instructions=INSTRUCTIONS, retries=3)
-
-        @agent.tool
-        async def calculator(ctx: RunContext[None], expression: str) -> float:
-            return calc.evaluate(expression)
-
-        @agent.tool
-        async def list_dir(ctx: RunContext[None], path: str = ".", tree: bool = True, max_depth: int = 2) -> str:
-            return fs.list_dir(path=path, tree=tree, max_depth=max_depth)
-
-        @agent.tool
-        async def read_file(ctx: RunContext[None], path: str, max_bytes: int = 200_000) -> str:
-            return fs.read_file(path=path, max_bytes=max_bytes)
-
-        @agent.tool
-        async def write_file(ctx: RunContext[None], path: str, content: str) -> str:
-            return fs.write_file(path=path, content=content)
-
-        @agent.tool
-        async def append_file(ctx: RunContext[None], path: str, content: str) -> str:
-            return fs.append_file(path=path, content=content)
-
-        @agent.tool
-        async def copy_file(ctx: RunContext[None], src: str, dst: str, overwrite: bool = False) -> str:
-            return fs.copy_file(src=src, dst=dst, overwrite=overwrite)
-
-        @agent.tool
-        async def move_file(ctx: RunContext[None], src: str, dst: str, overwrite: bool = False) -> str:
-            return fs.move_file(src=src, dst=dst, overwrite=overwrite)
-
-        @agent.tool
-        async def create_file(ctx: RunContext[None], path: str, content: str = "") -> str:
-            return fs.create_file(path=path, content=content)
-
-        @agent.tool
-        async def create_files_sequence(
-            ctx: RunContext[None], prefix: str, suffix: str, start: int, end: int, zero_pad: int = 0, content: str = ""
-        ) -> str:
-            return fs.create_files_sequence(prefix=prefix, suffix=suffix, start=start, end=end, zero_pad=zero_pad, content=content)
-
-        @agent.tool
-        async def rename_file(ctx: RunContext[None], old_path: str, new_path: str) -> str:
-            return fs.rename_file(old_path=old_path, new_path=new_path)
-
-        @agent.tool
-        async def rename_files_sequence(
-            ctx: RunContext[None],
-            old_prefix: str, old_suffix: str,
-            new_prefix: str, new_suffix: str,
-            start: int, end: int, zero_pad: int = 0,
-            skip_missing: bool = True, overwrite: bool = False
-        ) -> str:
-            return fs.rename_files_sequence(
-                old_prefix=old_prefix, old_suffix=old_suffix,
-                new_prefix=new_prefix, new_suffix=new_suffix,
-                start=start, end=end, zero_pad=zero_pad,
-                skip_missing=skip_missing, overwrite=overwrite
-            )
-
-        @agent.tool
-        async def delete_file(ctx: RunContext[None], path: str) -> str:
-            return fs.delete_file(path=path)
-
-        @agent.tool
-        async def delete_glob(ctx: RunContext[None], pattern: str) -> str:
-            return fs.delete_glob(pattern=pattern)
-
-        @agent.tool
-        async def create_folder(ctx: RunContext[None], path: str, exist_ok: bool = True) -> str:
-            return fs.create_folder(path=path, exist_ok=exist_ok)
-
-        @agent.tool
-        async def create_folders_sequence(
-            ctx: RunContext[None], prefix: str, suffix: str = "", start: int = 1, end: int = 1, zero_pad: int = 0
-        ) -> str:
-            return fs.create_folders_sequence(prefix=prefix, suffix=suffix, start=start, end=end, zero_pad=zero_pad)
-
-        @agent.tool
-        async def delete_folder(ctx: RunContext[None], path: str, recursive: bool = False) -> str:
-            return fs.delete_folder(path=path, recursive=recursive)
-
-        @agent.tool
-        async def bulk_rename_regex(
-            ctx: RunContext[None], base_path: str, pattern: str, replacement: str,
-            include_subdirs: bool = True, test_only: bool = False
-        ) -> str:
-            return fs.bulk_rename_regex(
-                base_path=base_path, pattern=pattern, replacement=replacement,
-                include_subdirs=include_subdirs, test_only=test_only
-            )
-
-        return agent
+    def build(model) -> Agent[Deps]:
+        return Agent(model, deps_type=Deps, instructions=INSTRUCTIONS, tools=TOOLS, retries=3)
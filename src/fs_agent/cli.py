@@ -7,7 +7,7 @@ from .config import Config
 from .engines import EngineFactory
 from .services.filesystem import FileSandbox
 from .services.calculator import CalculatorService
-from .agent import AgentFactory
+from .agent import AgentFactory, Deps
 from .ui import console, banner, ai_panel
 
 class FSAgentApp:
@@ -17,21 +17,19 @@ class FSAgentApp:
         self.cfg = cfg or Config.load()
         self.sandbox = FileSandbox(self.cfg.sandbox_dir)
         self.calc = CalculatorService()
+        self.deps = Deps(fs=self.sandbox, calc=self.calc)
         self.engine = "local"
         self.model_name = self.cfg.ollama_model
         self.model, self.provider_label = EngineFactory.build(self.engine, self.model_name, self.cfg)
-        self.agent = AgentFactory.build(self.model, self.sandbox, self.calc)
+        self.agent = AgentFactory.build(self.model)
 
     def get_files_list(self) -> str:
-        self.sandbox.ensure()
-        import os
-        names = sorted(os.listdir(self.sandbox.root))
-        return "\n".join(names) if names else "(empty)"
+        return self.sandbox.list_names()
 
     def switch_model(self, engine: str, model_name: str | None) -> None:
         new_model_name = model_name or (self.cfg.ollama_model if engine == "local" else self.cfg.gemini_model)
+        # The agent (and its tool schemas) is reused; runs pass the model explicitly
         self.model, self.provider_label = EngineFactory.build(engine, new_model_name, self.cfg)
-        self.agent = AgentFactory.build(self.model, self.sandbox, self.calc)
         self.engine = engine
         self.model_name = new_model_name
         console.print(
@@ -80,7 +78,7 @@ class FSAgentApp:
             started = time.perf_counter()
             try:
                 with console.status("[brand]thinking…[/brand]", spinner="dots"):
-                    response = self.agent.run_sync(prompt)
+                    response = self.agent.run_sync(prompt, model=self.model, deps=self.deps)
             except Exception as e:
                 console.print(f"[err]Error:[/err] {e}\n")
                 continue
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Tuple
+from typing import Dict, Tuple
 
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
@@ -7,6 +7,10 @@ from pydantic_ai.providers.openai import OpenAIProvider
 from .config import Config
 from .ui import console
 
+# Providers own the HTTP client (and its connection pool); reuse them across
+# /model switches so warm connections survive. Keyed by (engine, endpoint/key).
+_provider_cache: Dict[tuple, object] = {}
+
 class EngineFactory:
     """Builds model backends for Agent."""
 
@@ -34,11 +38,17 @@ class EngineFactory:
                 )
                 raise RuntimeError("Missing Google API key")
 
-            provider = GoogleProvider(api_key=cfg.google_api_key)
+            key = ("gemini", cfg.google_api_key)
+            provider = _provider_cache.get(key)
+            if provider is None:
+                provider = _provider_cache[key] = GoogleProvider(api_key=cfg.google_api_key)
             model = GoogleModel(model_name or cfg.gemini_model, provider=provider)
             return model, "Google AI (Gemini)"
 
         # default: local (Ollama/OpenAI-compatible)
-        provider = OpenAIProvider(base_url=cfg.ollama_base_url, api_key="ollama")
+        key = ("ollama", cfg.ollama_base_url)
+        provider = _provider_cache.get(key)
+        if provider is None:
+            provider = _provider_cache[key] = OpenAIProvider(base_url=cfg.ollama_base_url, api_key="ollama")
         model = OpenAIChatModel(model_name or cfg.ollama_model, provider=provider)
         return model, f"Ollama @ {cfg.ollama_base_url}"
@@ -1,22 +1,74 @@
-from dataclasses import dataclass, field
-from typing import Optional
-from asteval import Interpreter
+import ast
+from dataclasses import dataclass
+from functools import lru_cache
+from types import CodeType
+
+_BIN_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_UNARY_OPS = (ast.UAdd, ast.USub)
+# Same cap asteval used: only large *positive* exponents can hang (9**9**9);
+# negative ones just underflow towards 0.0
+_MAX_EXPONENT = 10_000
+
+
+def _pow(base, exp):
+    if exp > _MAX_EXPONENT:
+        raise ValueError(f"exponent {exp} exceeds limit {_MAX_EXPONENT}")
+    return base ** exp
+
+
+# Compiled expressions only ever see numeric constants, operators and _pow
+_GLOBALS = {"__builtins__": {}, "_pow": _pow}
+
+
+class _Arithmetic(ast.NodeTransformer):
+    """Reject anything but arithmetic and route ** through the capped _pow.
+
+    Turning ** into a call also stops CPython from constant-folding a huge
+    power at compile time.
+    """
+
+    def generic_visit(self, node: ast.AST):
+        raise ValueError(f"unsupported syntax: {type(node).__name__}")
+
+    def visit_Expression(self, node: ast.Expression):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Constant(self, node: ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ValueError(f"unsupported constant: {node.value!r}")
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp):
+        if not isinstance(node.op, _UNARY_OPS):
+            raise ValueError(f"unsupported operator: {type(node.op).__name__}")
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp):
+        if not isinstance(node.op, _BIN_OPS):
+            raise ValueError(f"unsupported operator: {type(node.op).__name__}")
+        node.left, node.right = self.visit(node.left), self.visit(node.right)
+        if isinstance(node.op, ast.Pow):
+            call = ast.Call(func=ast.Name("_pow", ast.Load()), args=[node.left, node.right], keywords=[])
+            return ast.copy_location(call, node)
+        return node
+
+
+@lru_cache(maxsize=1024)
+def _compile(expression: str) -> CodeType:
+    """Validate once per distinct expression; repeats are a dict lookup + eval."""
+    tree = _Arithmetic().visit(ast.parse(expression, mode="eval"))
+    return compile(ast.fix_missing_locations(tree), "<calc>", "eval")
+
 
 @dataclass(slots=True)
 class CalculatorService:
-    """Safe arithmetic evaluation using asteval."""
-    _interp: Optional[Interpreter] = field(init=False, repr=False, default=None)
-
-    def __post_init__(self) -> None:
-        # Disable numpy to keep evaluation simple and safe
-        self._interp = Interpreter(use_numpy=False)
+    """Safe arithmetic evaluation (+ - * / // % ** and unary +/-)."""
 
     def evaluate(self, expression: str) -> float:
-        if self._interp is None:
-            # Shouldn't happen, but keeps mypy/pyright happy
-            self._interp = Interpreter(use_numpy=False)
         try:
-            val = self._interp(expression)
+            val = eval(_compile(expression.strip()), _GLOBALS)
             if not isinstance(val, (int, float)):
                 raise ValueError("Expression did not evaluate to a number")
             return float(val)
@@ -1,40 +1,300 @@
 from __future__ import annotations
-import glob
+import errno
+import fnmatch
+import functools
+import os
 import re
 import shutil
-from dataclasses import dataclass
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
+
+# Opening a FIFO for reading blocks until a writer shows up; O_NONBLOCK lets
+# us fstat it and refuse instead. No-op for regular files; absent on Windows.
+_O_NONBLOCK = getattr(os, "O_NONBLOCK", 0)
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_GLOB_MAGIC = re.compile(r"[*?[]")
+# errnos meaning "this copy primitive doesn't apply here", not a real I/O error
+_COPY_FALLBACK_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK)
+
+def _mutating(method):
+    """Drop cached listings once a mutating op finishes (even if it failed)."""
+    @functools.wraps(method)
+    def wrapper(self: "FileSandbox", *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._listing_cache.clear()
+    return wrapper
+
+def _unlink_quiet(path: Union[str, Path]) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 @dataclass(slots=True)
 class FileSandbox:
     """Guard filesystem operations inside a sandbox directory."""
     root: Path
+    _resolved_root: Optional[Path] = field(init=False, repr=False, default=None)
+    # (dir, kind...) -> (dir st_mtime_ns, cached_at, rendered listing)
+    _listing_cache: Dict[tuple, Tuple[int, float, str]] = field(init=False, repr=False, default_factory=dict)
+
+    # Seconds a listing may be reused; bounds staleness from edits made outside
+    # the sandbox API (those don't always bump the directory mtime).
+    LISTING_TTL: ClassVar[float] = 2.0
+    # Below this many files a thread pool costs more than the unlinks it overlaps.
+    PARALLEL_UNLINK_MIN: ClassVar[int] = 64
 
     def ensure(self) -> None:
         self.root.mkdir(parents=True, exist_ok=True)
+        if self._resolved_root is None:
+            self._resolved_root = self.root.resolve()
 
     # ---------- internal helpers ----------
     def _resolve(self, rel: str) -> Tuple[Path, Path]:
         """Return (sandbox_abs, target_abs) and ensure target is inside sandbox."""
-        sandbox = self.root.resolve()
-        target = (self.root / rel).resolve()
-        if not (target == sandbox or str(target).startswith(str(sandbox) + self._sep())):
+        sandbox = self._resolved_root
+        if sandbox is None:
+            self.ensure()
+            sandbox = self._resolved_root
+        target = (sandbox / rel).resolve()
+        if not target.is_relative_to(sandbox):
             raise ValueError(f"For security reasons, paths must stay inside {sandbox}. Got: {target}")
         return sandbox, target
 
+    def _resolve_cached(self, rel: str, parents: Dict[str, str]) -> str:
+        """Like _resolve, but resolves each parent directory only once per batch.
+
+        The leaf name is joined without resolving it; the sequence ops never
+        follow a leaf symlink (they create/rename/mkdir the entry itself).
+        Returns a plain string path to skip Path allocation in hot loops.
+        """
+        head, tail = os.path.split(rel)
+        if tail in ("", ".", ".."):
+            return str(self._resolve(rel)[1])
+        parent = parents.get(head)
+        if parent is None:
+            parent = parents[head] = str(self._resolve(head or ".")[1])
+        return os.path.join(parent, tail)
+
+    @staticmethod
+    def _replace(old: str, new: str, overwrite: bool) -> None:
+        """Move old to new with one os.replace in the common case.
+
+        Creates new's parent only if the first attempt hits ENOENT, and with
+        overwrite=True clears a directory (or file-vs-directory) target.
+        """
+        try:
+            os.replace(old, new)
+        except FileNotFoundError:
+            if not os.path.lexists(old):
+                raise
+            os.makedirs(os.path.dirname(new), exist_ok=True)
+            os.replace(old, new)
+        except OSError as e:
+            # e.g. ENOTDIR when part of old's prefix is a file: still a missing source
+            if not os.path.lexists(old):
+                raise
+            if not overwrite or e.errno not in (errno.EISDIR, errno.ENOTDIR, errno.ENOTEMPTY, errno.EEXIST) \
+                    or not os.path.lexists(new):
+                raise
+            if os.path.isdir(new) and not os.path.islink(new):
+                shutil.rmtree(new)
+            else:
+                os.unlink(new)
+            os.replace(old, new)
+
+    def _cached_listing(self, key: tuple, mtime_ns: int, build: Callable[[], str]) -> str:
+        now = time.monotonic()
+        hit = self._listing_cache.get(key)
+        if hit is not None and hit[0] == mtime_ns and now - hit[1] < self.LISTING_TTL:
+            return hit[2]
+        result = build()
+        self._listing_cache[key] = (mtime_ns, now, result)
+        return result
+
     @staticmethod
-    def _sep() -> str:
-        import os
-        return os.sep
+    def _seq_template(prefix: str, suffix: str, zero_pad: int) -> str:
+        """Return a str.format template for '<prefix><i zero-padded><suffix>'."""
+        def esc(t: str) -> str:
+            return t.replace("{", "{{").replace("}", "}}")
+        return f"{esc(prefix)}{{:0{zero_pad}d}}{esc(suffix)}" if zero_pad > 0 else f"{esc(prefix)}{{}}{esc(suffix)}"
+
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    @staticmethod
+    def _open_creating_parent(path: Union[str, Path], flags: int, mode: int = 0o644) -> int:
+        """os.open that creates missing parent folders only after an ENOENT."""
+        try:
+            return os.open(path, flags, mode)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            return os.open(path, flags, mode)
+
+    @staticmethod
+    def _copy_fd(s_fd: int, d_fd: int, size: int) -> None:
+        """Copy the rest of s_fd (expected to hold size bytes) into d_fd.
+
+        Tries copy_file_range (reflink/server-side copy on Linux), then
+        sendfile, then a plain read/write loop. All three advance the shared
+        file offsets, so a fallback resumes where the previous one stopped.
+        Some filesystems (FUSE, vboxsf, ...) answer the in-kernel calls with
+        0 without copying anything; a 0 before any byte of a non-empty file
+        is treated as "unsupported" rather than EOF, as shutil does.
+        """
+        chunk = 1 << 30
+        if hasattr(os, "copy_file_range"):
+            try:
+                copied = 0
+                while n := os.copy_file_range(s_fd, d_fd, chunk):
+                    copied += n
+                if copied or not size:
+                    return
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+        if hasattr(os, "sendfile"):
+            try:
+                copied = 0
+                while n := os.sendfile(d_fd, s_fd, None, chunk):
+                    copied += n
+                if copied or not size:
+                    return
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+        while buf := os.read(s_fd, 1 << 20):
+            FileSandbox._write_all(d_fd, buf)
 
     @staticmethod
     def _format_size(n: int) -> str:
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if n < 1024:
-                return f"{n:.0f} {unit}"
-            n /= 1024
-        return f"{n:.0f} PB"
+        if n < 1024:
+            return f"{n} B"
+        # each unit is 10 more bits; one table lookup and one division
+        i = min((n.bit_length() - 1) // 10, 5)
+        return f"{n / (1 << (10 * i)):.0f} {_SIZE_UNITS[i]}"
+
+    @classmethod
+    def _entry_size(cls, e: os.DirEntry) -> str:
+        """Formatted size of a file entry; a symlink reports its target's size."""
+        try:
+            return cls._format_size(e.stat().st_size)
+        except OSError:
+            return "?"
+
+    @staticmethod
+    def _scan_sorted(dir_path: str) -> List[Tuple[bool, os.DirEntry]]:
+        """(is_dir, entry) pairs, folders first then case-insensitive by name.
+
+        DirEntry carries the file type from readdir, so the dir/file split
+        costs no stat calls (only symlinks are stat'ed, to classify their
+        target); it is computed once here and handed to callers.
+        """
+        with os.scandir(dir_path) as it:
+            pairs = [(e.is_dir(), e) for e in it]
+        pairs.sort(key=lambda de: (not de[0], de[1].name.lower()))
+        return pairs
+
+    @staticmethod
+    def _iter_dirs(base: str, include_subdirs: bool) -> Iterator[Tuple[str, List[str]]]:
+        """Yield (dirpath, filenames) for base and, optionally, its subfolders.
+
+        Only regular files (or symlinks to them) are listed, in both modes;
+        DirEntry.is_file() answers from the readdir type without a stat for
+        non-links. Folders come in sorted order, symlinked ones are not
+        entered; filenames are left unsorted so callers only pay to sort the
+        entries they keep.
+        """
+        stack = [base]
+        while stack:
+            dirpath = stack.pop()
+            names: List[str] = []
+            subdirs: List[str] = []
+            try:
+                with os.scandir(dirpath) as it:
+                    for e in it:
+                        if e.is_file():
+                            names.append(e.name)
+                        elif include_subdirs and e.is_dir(follow_symlinks=False):
+                            subdirs.append(e.path)
+            except OSError:
+                if dirpath == base:
+                    raise
+                continue  # like os.walk, skip subfolders we can't list
+            yield dirpath, names
+            subdirs.sort(reverse=True)
+            stack.extend(subdirs)
+
+    @staticmethod
+    def _glob_files(root: str, pattern: str) -> List[str]:
+        """Files under root matching a recursive glob ('*', '?', '[..]', '**').
+
+        Follows glob.glob(recursive=True) semantics: wildcards don't match a
+        leading '.', and only directories that can still match the remaining
+        segments are scanned. Symlinked directories are not descended into,
+        so every match is inside root by construction and needs no resolve().
+        """
+        segs = [seg for seg in pattern.replace(os.sep, "/").split("/") if seg not in ("", ".")]
+        if os.path.isabs(pattern) or ".." in segs:
+            raise ValueError(f"For security reasons, patterns must stay inside {root}. Got: {pattern}")
+        if not segs:
+            return []
+        rxs = [None if seg == "**" or not _GLOB_MAGIC.search(seg) else re.compile(fnmatch.translate(seg))
+               for seg in segs]
+        last = len(segs) - 1
+        found: Dict[str, None] = {}  # ordered set; '**' can reach a file twice
+        stack: List[Tuple[str, int]] = [(root, 0)]
+        while stack:
+            dir_path, i = stack.pop()
+            seg = segs[i]
+            if seg == "**":
+                if i < last:
+                    stack.append((dir_path, i + 1))  # '**' matching zero folders
+                try:
+                    with os.scandir(dir_path) as it:
+                        for e in it:
+                            if e.name.startswith("."):
+                                continue
+                            if e.is_dir(follow_symlinks=False):
+                                stack.append((e.path, i))
+                            elif i == last and e.is_file():
+                                found[e.path] = None
+                except (FileNotFoundError, NotADirectoryError, PermissionError):
+                    pass
+                continue
+            rx = rxs[i]
+            if rx is None:
+                # literal segment: one lstat instead of a directory scan
+                path = os.path.join(dir_path, seg)
+                if i == last:
+                    if os.path.isfile(path):
+                        found[path] = None
+                elif os.path.isdir(path) and not os.path.islink(path):
+                    stack.append((path, i + 1))
+                continue
+            hidden_ok = seg.startswith(".")
+            try:
+                with os.scandir(dir_path) as it:
+                    for e in it:
+                        if (e.name.startswith(".") and not hidden_ok) or not rx.match(e.name):
+                            continue
+                        if i == last:
+                            if e.is_file():
+                                found[e.path] = None
+                        elif e.is_dir(follow_symlinks=False):
+                            stack.append((e.path, i + 1))
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                pass
+        return list(found)
 
     def tree(self, base: Path, max_depth: int = 2) -> str:
         """Return a pretty tree for base (inside sandbox)."""
@@ -43,64 +303,103 @@ class FileSandbox:
         if max_depth < 0:
             return "\n".join(lines)
 
-        def walk(dir_path: Path, prefix: str, depth: int) -> None:
+        # Explicit stack instead of recursion; items are either rendered lines
+        # or (dir_path, prefix, depth) directories still to expand.
+        stack: List[Union[str, Tuple[str, str, int]]] = [(str(base), "", 1)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                lines.append(item)
+                continue
+            dir_path, prefix, depth = item
             if depth > max_depth:
-                return
+                continue
             try:
-                entries = sorted(dir_path.iterdir(), key=lambda p: (p.is_file(), p.name.lower()))
+                entries = self._scan_sorted(dir_path)
             except PermissionError:
                 lines.append(prefix + "└── [permission denied]")
-                return
+                continue
 
+            pending: List[Union[str, Tuple[str, str, int]]] = []
             total = len(entries)
-            for i, p in enumerate(entries):
+            for i, (is_dir, e) in enumerate(entries):
                 last = (i == total - 1)
                 branch = "└── " if last else "├── "
-                if p.is_dir():
-                    lines.append(prefix + branch + p.name + "/")
-                    new_prefix = prefix + ("    " if last else "│   ")
-                    walk(p, new_prefix, depth + 1)
+                if is_dir and e.is_symlink():
+                    # shown, but never descended into: it may lead outside the sandbox
+                    pending.append(prefix + branch + e.name + "/ (link)")
+                elif is_dir:
+                    pending.append(prefix + branch + e.name + "/")
+                    pending.append((e.path, prefix + ("    " if last else "│   "), depth + 1))
                 else:
-                    try:
-                        size = self._format_size(p.stat().st_size)
-                    except Exception:
-                        size = "?"
-                    lines.append(prefix + branch + f"{p.name} ({size})")
-
-        walk(base, "", 1)
+                    pending.append(prefix + branch + f"{e.name} ({self._entry_size(e)})")
+            stack.extend(reversed(pending))
         return "\n".join(lines)
 
     # ---------- public ops (1:1 with your tools) ----------
     def list_dir(self, path: str = ".", tree: bool = True, max_depth: int = 2) -> str:
         self.ensure()
         _, p = self._resolve(path)
-        if not p.exists():
-            raise ValueError(f"Path {path} does not exist.")
-        if tree:
-            return self.tree(p, max_depth=max_depth)
-        if p.is_file():
+        try:
             st = p.stat()
+        except OSError:
+            raise ValueError(f"Path {path} does not exist.")
+        if not stat.S_ISDIR(st.st_mode):
+            if tree:
+                return self.tree(p, max_depth=max_depth)
             return f"{p.name}\t{self._format_size(st.st_size)}"
+        if tree:
+            return self._cached_listing((str(p), "tree", max_depth), st.st_mtime_ns,
+                                        lambda: self.tree(p, max_depth=max_depth))
+        return self._cached_listing((str(p), "flat"), st.st_mtime_ns, lambda: self._flat_listing(str(p)))
+
+    def list_names(self) -> str:
+        """Sorted top-level names in the sandbox, one per line."""
+        self.ensure()
+        root = self._resolved_root
+        def build() -> str:
+            names = sorted(os.listdir(root))
+            return "\n".join(names) if names else "(empty)"
+        return self._cached_listing((str(root), "names"), os.stat(root).st_mtime_ns, build)
+
+    def _flat_listing(self, dir_path: str) -> str:
+        """One scandir pass; only file entries pay a stat (for their size)."""
         names = []
-        for child in sorted(p.iterdir(), key=lambda c: (c.is_file(), c.name.lower())):
-            label = child.name + ("/" if child.is_dir() else "")
-            try:
-                size = self._format_size(child.stat().st_size) if child.is_file() else "-"
-            except Exception:
-                size = "?"
-            names.append(f"{label}\t{size}")
+        for is_dir, e in self._scan_sorted(dir_path):
+            if is_dir:
+                names.append(f"{e.name}/\t-")
+                continue
+            names.append(f"{e.name}\t{self._entry_size(e)}")
         return "\n".join(names) if names else "(empty)"
 
     def read_file(self, path: str, max_bytes: int = 200_000) -> str:
         self.ensure()
         _, file_path = self._resolve(path)
-        if not file_path.exists() or not file_path.is_file():
+        try:
+            fd = os.open(file_path, os.O_RDONLY | _O_NONBLOCK)
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(f"File {path} does not exist.")
-        size = file_path.stat().st_size
-        if size > max_bytes:
-            raise ValueError(f"File is {size} bytes; exceeds limit {max_bytes}. Increase max_bytes if needed.")
-        return file_path.read_text(encoding="utf-8", errors="replace")
+        try:
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
+                raise ValueError(f"File {path} does not exist.")
+            # read at most max_bytes + 1: one byte over the limit is enough to
+            # reject the file, so memory stays bounded whatever its size
+            chunks: List[bytes] = []
+            remaining = max_bytes + 1
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            if remaining <= 0:
+                size = os.fstat(fd).st_size
+                raise ValueError(f"File is {size} bytes; exceeds limit {max_bytes}. Increase max_bytes if needed.")
+        finally:
+            os.close(fd)
+        return b"".join(chunks).decode("utf-8", errors="replace")
 
+    @_mutating
     def write_file(self, path: str, content: str) -> str:
         self.ensure()
         _, file_path = self._resolve(path)
@@ -108,26 +407,54 @@ class FileSandbox:
         file_path.write_text(content or "", encoding="utf-8")
         return str(file_path)
 
+    @_mutating
     def append_file(self, path: str, content: str) -> str:
         self.ensure()
         _, file_path = self._resolve(path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open("a", encoding="utf-8") as f:
-            f.write(content or "")
+        fd = self._open_creating_parent(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            self._write_all(fd, (content or "").encode("utf-8"))
+        finally:
+            os.close(fd)
         return str(file_path)
 
+    @_mutating
     def copy_file(self, src: str, dst: str, overwrite: bool = False) -> str:
         self.ensure()
         _, s = self._resolve(src)
         _, d = self._resolve(dst)
-        if not s.exists() or not s.is_file():
+        try:
+            s_fd = os.open(s, os.O_RDONLY | _O_NONBLOCK)
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(f"Source file {src} does not exist.")
-        if d.exists() and not overwrite:
-            raise ValueError(f"Destination {dst} already exists. Use overwrite=True.")
-        d.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(s, d)
+        try:
+            st = os.fstat(s_fd)
+            if not stat.S_ISREG(st.st_mode):
+                raise ValueError(f"Source file {src} does not exist.")
+            if overwrite:
+                try:
+                    if os.path.samestat(st, os.stat(d)):
+                        raise ValueError("Source and destination are the same file.")
+                except FileNotFoundError:
+                    pass
+            # O_EXCL doubles as the "already exists" check when not overwriting
+            flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if overwrite else os.O_EXCL)
+            try:
+                d_fd = self._open_creating_parent(d, flags, st.st_mode & 0o777)
+            except FileExistsError:
+                raise ValueError(f"Destination {dst} already exists. Use overwrite=True.")
+            except IsADirectoryError:
+                raise ValueError(f"Destination {dst} is a directory.")
+            try:
+                self._copy_fd(s_fd, d_fd, st.st_size)
+            finally:
+                os.close(d_fd)
+        finally:
+            os.close(s_fd)
+        os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns))
         return str(d)
 
+    @_mutating
     def move_file(self, src: str, dst: str, overwrite: bool = False) -> str:
         self.ensure()
         _, s = self._resolve(src)
@@ -149,6 +476,7 @@ class FileSandbox:
         shutil.move(str(s), str(d))
         return str(d)
 
+    @_mutating
     def create_file(self, path: str, content: str = "") -> str:
         self.ensure()
         _, file_path = self._resolve(path)
@@ -158,25 +486,39 @@ class FileSandbox:
         file_path.write_text(content or "", encoding="utf-8")
         return str(file_path)
 
+    @_mutating
     def create_files_sequence(self, prefix: str, suffix: str, start: int, end: int,
                               zero_pad: int = 0, content: str = "") -> str:
         self.ensure()
         created: List[str] = []
         skipped: List[str] = []
+        parents: Dict[str, str] = {}
+        made: set[str] = set()
+        data = (content or "").encode("utf-8")
+        tmpl = self._seq_template(prefix, suffix, zero_pad)
         for i in range(start, end + 1):
-            num = str(i).zfill(zero_pad) if zero_pad > 0 else str(i)
-            rel = f"{prefix}{num}{suffix}"
-            _, p = self._resolve(rel)
-            if p.exists():
+            rel = tmpl.format(i)
+            p = self._resolve_cached(rel, parents)
+            parent = os.path.dirname(p)
+            if parent not in made:
+                os.makedirs(parent, exist_ok=True)
+                made.add(parent)
+            # O_EXCL makes "already exists" the skip signal, no stat needed
+            try:
+                fd = os.open(p, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
                 skipped.append(rel); continue
-            p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_text(content or "", encoding="utf-8")
+            try:
+                self._write_all(fd, data)
+            finally:
+                os.close(fd)
             created.append(rel)
         return (
             "Created:\n" + ("\n".join(created) if created else "(none)") +
             "\n\nSkipped (already existed):\n" + ("\n".join(skipped) if skipped else "(none)")
         )
 
+    @_mutating
     def rename_file(self, old_path: str, new_path: str) -> str:
         self.ensure()
         _, old_file_path = self._resolve(old_path)
@@ -187,6 +529,7 @@ class FileSandbox:
         old_file_path.rename(new_file_path)
         return str(new_file_path)
 
+    @_mutating
     def rename_files_sequence(
         self,
         old_prefix: str, old_suffix: str,
@@ -198,25 +541,30 @@ class FileSandbox:
         renamed: List[str] = []
         missing: List[str] = []
         conflicted: List[str] = []
+        parents: Dict[str, str] = {}
+        old_tmpl = self._seq_template(old_prefix, old_suffix, zero_pad)
+        new_tmpl = self._seq_template(new_prefix, new_suffix, zero_pad)
         for i in range(start, end + 1):
-            num = str(i).zfill(zero_pad) if zero_pad > 0 else str(i)
-            old_rel = f"{old_prefix}{num}{old_suffix}"
-            new_rel = f"{new_prefix}{num}{new_suffix}"
-            _, old_p = self._resolve(old_rel)
-            _, new_p = self._resolve(new_rel)
-            if not old_p.exists():
+            old_rel = old_tmpl.format(i)
+            new_rel = new_tmpl.format(i)
+            old_p = self._resolve_cached(old_rel, parents)
+            new_p = self._resolve_cached(new_rel, parents)
+            try:
+                # os.replace/os.rename clobber files on POSIX, so without
+                # overwrite the target still needs one existence probe.
+                if not overwrite and os.path.lexists(new_p):
+                    if os.path.lexists(old_p):
+                        conflicted.append(new_rel); continue
+                    raise FileNotFoundError(old_p)
+                self._replace(old_p, new_p, overwrite)
+            except (FileNotFoundError, NotADirectoryError):
+                # ENOTDIR can also come from the target side (a file where
+                # new's prefix expects a folder); only a gone source is "missing"
+                if os.path.lexists(old_p):
+                    raise ValueError(f"Cannot create {new_rel}: parent is not a directory")
                 if not skip_missing:
                     raise ValueError(f"Missing: {old_rel}")
                 missing.append(old_rel); continue
-            if new_p.exists():
-                if not overwrite:
-                    conflicted.append(new_rel); continue
-                if new_p.is_file():
-                    new_p.unlink()
-                else:
-                    shutil.rmtree(new_p)
-            new_p.parent.mkdir(parents=True, exist_ok=True)
-            old_p.rename(new_p)
             renamed.append(f"{old_rel} -> {new_rel}")
         return (
             "Renamed:\n" + ("\n".join(renamed) if renamed else "(none)") +
@@ -224,6 +572,7 @@ class FileSandbox:
             "\n\nConflicted (exists, not overwritten):\n" + ("\n".join(conflicted) if conflicted else "(none)")
         )
 
+    @_mutating
     def delete_file(self, path: str) -> str:
         self.ensure()
         _, file_path = self._resolve(path)
@@ -234,22 +583,22 @@ class FileSandbox:
         file_path.unlink()
         return str(file_path)
 
+    @_mutating
     def delete_glob(self, pattern: str) -> str:
         self.ensure()
-        matches: list[Path] = []
-        for rel in glob.glob(str(self.root / pattern), recursive=True):
-            p = Path(rel).resolve()
-            sandbox = self.root.resolve()
-            if not (str(p).startswith(str(sandbox) + self._sep()) or p == sandbox):
-                continue
-            if p.is_file():
-                matches.append(p)
+        matches = self._glob_files(str(self._resolved_root), pattern)
         if not matches:
             return "No files matched."
-        for p in matches:
-            p.unlink(missing_ok=True)
+        if len(matches) < self.PARALLEL_UNLINK_MIN:
+            for p in matches:
+                _unlink_quiet(p)
+        else:
+            # unlinks are independent, so let the kernel overlap them
+            with ThreadPoolExecutor(max_workers=min(32, len(matches))) as ex:
+                list(ex.map(_unlink_quiet, matches))
         return f"Deleted {len(matches)} files."
 
+    @_mutating
     def create_folder(self, path: str, exist_ok: bool = True) -> str:
         self.ensure()
         _, d = self._resolve(path)
@@ -258,23 +607,28 @@ class FileSandbox:
         d.mkdir(parents=True, exist_ok=exist_ok)
         return str(d)
 
+    @_mutating
     def create_folders_sequence(self, prefix: str, suffix: str = "", start: int = 1, end: int = 1, zero_pad: int = 0) -> str:
         self.ensure()
         created: List[str] = []
         skipped: List[str] = []
+        parents: Dict[str, str] = {}
+        tmpl = self._seq_template(prefix, suffix, zero_pad)
         for i in range(start, end + 1):
-            num = str(i).zfill(zero_pad) if zero_pad > 0 else str(i)
-            rel = f"{prefix}{num}{suffix}"
-            _, d = self._resolve(rel)
-            if d.exists():
+            rel = tmpl.format(i)
+            d = self._resolve_cached(rel, parents)
+            # lexists: a leaf symlink (even one pointing outside the sandbox or
+            # nowhere) counts as an existing entry and is never followed
+            if os.path.lexists(d):
                 skipped.append(rel); continue
-            d.mkdir(parents=True, exist_ok=True)
+            os.makedirs(d, exist_ok=True)
             created.append(rel)
         return (
             "Created:\n" + ("\n".join(created) if created else "(none)") +
             "\n\nSkipped (already existed):\n" + ("\n".join(skipped) if skipped else "(none)")
         )
 
+    @_mutating
     def delete_folder(self, path: str, recursive: bool = False) -> str:
         self.ensure()
         _, d = self._resolve(path)
@@ -291,31 +645,42 @@ class FileSandbox:
             raise ValueError(f"Folder {path} is not empty. Use recursive=True.")
         return f"Deleted empty folder {path}"
 
+    @_mutating
     def bulk_rename_regex(self, base_path: str, pattern: str, replacement: str,
                           include_subdirs: bool = True, test_only: bool = False) -> str:
         self.ensure()
-        _, base = self._resolve(base_path)
+        sandbox, base = self._resolve(base_path)
         if not base.exists():
             raise ValueError(f"Base path {base_path} does not exist.")
         if not base.is_dir():
             raise ValueError(f"Base path {base_path} is not a directory.")
 
         rx = re.compile(pattern)
+        root = str(sandbox)
         changes: List[str] = []
-        walker = base.rglob("*") if include_subdirs else base.glob("*")
-        for p in sorted(walker):
-            if not p.is_file():
+        for dirpath, names in self._iter_dirs(str(base), include_subdirs):
+            # match while walking; only hits are buffered (and sorted, for a
+            # stable preview order)
+            hits = [(name, new_name) for name in names
+                    if (new_name := rx.sub(replacement, name)) != name]
+            if not hits:
                 continue
-            new_name = rx.sub(replacement, p.name)
-            if new_name != p.name:
-                new_path = p.with_name(new_name)
-                # checks security on target
-                self._resolve(str(new_path.relative_to(self.root)))
+            hits.sort()
+            rel_dir = os.path.relpath(dirpath, root)
+            for name, new_name in hits:
+                # a bare name keeps the target in dirpath, which is inside the
+                # sandbox by construction, so no resolve() is needed
+                if not new_name or new_name in (".", "..") or os.sep in new_name \
+                        or (os.altsep and os.altsep in new_name):
+                    raise ValueError(f"Invalid name {new_name!r} for {name}")
+                old_rel = name if rel_dir == "." else os.path.join(rel_dir, name)
+                new_rel = new_name if rel_dir == "." else os.path.join(rel_dir, new_name)
                 if not test_only:
-                    if new_path.exists():
-                        raise ValueError(f"Target already exists: {new_path.relative_to(self.root)}")
-                    p.rename(new_path)
-                changes.append(f"{p.relative_to(self.root)} -> {new_path.relative_to(self.root)}")
+                    new_full = os.path.join(dirpath, new_name)
+                    if os.path.lexists(new_full):
+                        raise ValueError(f"Target already exists: {new_rel}")
+                    os.rename(os.path.join(dirpath, name), new_full)
+                changes.append(f"{old_rel} -> {new_rel}")
         if not changes:
             return "No matches."
         return ("Preview (no changes):\n" if test_only else "Renamed:\n") + "\n".join(changes)
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from fs_agent.agent import AgentFactory, Deps
+from fs_agent.services.calculator import CalculatorService
+from fs_agent.services.filesystem import FileSandbox
+
+def test_mutating_tools_keep_emitted_order(tmp_path: Path):
+    returns: list[ToolReturnPart] = []
+
+    def model(messages, info: AgentInfo) -> ModelResponse:
+        if len(messages) == 1:
+            # one turn: a slow write, then a read that depends on it
+            return ModelResponse(parts=[
+                ToolCallPart("create_files_sequence", {"prefix": "f", "suffix": ".txt", "start": 1, "end": 3000}),
+                ToolCallPart("read_file", {"path": "f3000.txt"}),
+            ])
+        returns.extend(p for p in messages[-1].parts if isinstance(p, ToolReturnPart))
+        return ModelResponse(parts=[TextPart("done")])
+
+    deps = Deps(fs=FileSandbox(tmp_path), calc=CalculatorService())
+    result = AgentFactory.build(FunctionModel(model)).run_sync("go", deps=deps)
+    assert result.output == "done"
+    assert [p.tool_name for p in returns] == ["create_files_sequence", "read_file"]
+    assert returns[1].content == ""
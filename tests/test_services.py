@@ -1,3 +1,5 @@
+import os
+import pytest
 from pathlib import Path
 from fs_agent.services.filesystem import FileSandbox
 from fs_agent.services.calculator import CalculatorService
@@ -5,6 +7,11 @@ from fs_agent.services.calculator import CalculatorService
 def test_calculator():
     calc = CalculatorService()
     assert calc.evaluate("2+2") == 4.0
+    assert calc.evaluate(" -(7 // 2) ** 2 % 5 ") == 1.0
+    assert calc.evaluate("10 ** -10001") == 0.0
+    for bad in ("__import__('os')", "x + 1", "2 ** 99999", "1 / 0"):
+        with pytest.raises(ValueError):
+            calc.evaluate(bad)
 
 def test_filesystem(tmp_path: Path):
     fs = FileSandbox(tmp_path)
@@ -17,3 +24,156 @@ def test_filesystem(tmp_path: Path):
     # delete
     fs.delete_file("hello.txt")
     assert "empty" in fs.list_dir(".", tree=False)
+
+def test_create_files_sequence(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.create_file("sub/f_02.txt", "old")
+    out = fs.create_files_sequence("sub/f_", ".txt", 1, 3, zero_pad=2, content="x")
+    assert "sub/f_01.txt\nsub/f_03.txt" in out
+    assert "Skipped (already existed):\nsub/f_02.txt" in out
+    assert fs.read_file("sub/f_01.txt") == "x"
+    assert fs.read_file("sub/f_02.txt") == "old"
+
+def test_listing_cache_invalidated_by_writes(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.create_file("a/log.txt", "x")
+    assert "log.txt (1 B)" in fs.list_dir(".")
+    assert fs.list_names() == "a"
+    # content-only change: directory mtime is untouched, cache must still drop
+    fs.append_file("a/log.txt", "yz")
+    assert "log.txt (3 B)" in fs.list_dir(".")
+    fs.create_folder("b")
+    assert fs.list_names() == "a\nb"
+
+def test_rename_files_sequence(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.create_files_sequence("f", ".txt", 1, 3, content="new")
+    fs.create_file("out/g2.md", "old")
+    out = fs.rename_files_sequence("f", ".txt", "out/g", ".md", 1, 4)
+    assert "f1.txt -> out/g1.md\nf3.txt -> out/g3.md" in out
+    assert "Missing:\nf4.txt" in out
+    assert "Conflicted (exists, not overwritten):\nout/g2.md" in out
+    assert fs.read_file("out/g2.md") == "old"
+    fs.create_folder("out/g5.md/inner")
+    fs.create_file("f5.txt", "five")
+    out = fs.rename_files_sequence("f", ".txt", "out/g", ".md", 2, 5, overwrite=True)
+    assert "f2.txt -> out/g2.md\nf5.txt -> out/g5.md" in out
+    assert fs.read_file("out/g2.md") == "new"
+    assert fs.read_file("out/g5.md") == "five"
+    with pytest.raises(ValueError):
+        fs.rename_files_sequence("f", ".txt", "g", ".txt", 1, 1, skip_missing=False)
+    # a file where the old prefix expects a folder just means "missing"
+    fs.create_file("x")
+    out = fs.rename_files_sequence("x/a", "", "b", "", 1, 2)
+    assert "Missing:\nx/a1\nx/a2" in out
+    # ...but a file blocking the *target* prefix is an error, not a missing source
+    fs.create_file("f9.txt")
+    fs.create_file("blocked")
+    for overwrite in (False, True):
+        with pytest.raises(ValueError, match="parent is not a directory"):
+            fs.rename_files_sequence("f", ".txt", "blocked/g", ".md", 9, 9, overwrite=overwrite)
+    assert fs.read_file("f9.txt") == ""
+
+def test_bulk_rename_regex(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.create_files_sequence("img_", ".jpg", 1, 2)
+    fs.create_file("sub/img_9.jpg")
+    preview = fs.bulk_rename_regex(".", r"^img_", "photo_", test_only=True)
+    assert preview.startswith("Preview (no changes):\nimg_1.jpg -> photo_1.jpg")
+    assert "sub/img_9.jpg -> sub/photo_9.jpg" in preview
+    assert "img_1.jpg" in fs.list_dir(".", tree=False)
+    out = fs.bulk_rename_regex(".", r"^img_", "photo_", include_subdirs=False)
+    assert "sub/" not in out
+    assert fs.list_dir("sub", tree=False).startswith("img_9.jpg")
+    with pytest.raises(ValueError):
+        fs.bulk_rename_regex(".", r"^photo_1", "../x")
+
+def test_copy_file(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.write_file("a.txt", "data" * 1000)
+    fs.copy_file("a.txt", "deep/b.txt")
+    assert fs.read_file("deep/b.txt") == "data" * 1000
+    with pytest.raises(ValueError):
+        fs.copy_file("a.txt", "deep/b.txt")
+    fs.write_file("a.txt", "new")
+    fs.copy_file("a.txt", "deep/b.txt", overwrite=True)
+    assert fs.read_file("deep/b.txt") == "new"
+    with pytest.raises(ValueError):
+        fs.copy_file("a.txt", "a.txt", overwrite=True)
+    assert fs.read_file("a.txt") == "new"
+    with pytest.raises(ValueError):
+        fs.copy_file("missing.txt", "c.txt")
+
+def test_delete_glob(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.create_files_sequence("logs/run_", ".log", 1, 100)
+    fs.create_file("logs/keep.txt")
+    fs.create_file("top.log")
+    assert fs.delete_glob("logs/*.log") == "Deleted 100 files."
+    assert fs.list_dir("logs", tree=False).startswith("keep.txt")
+    assert fs.delete_glob("**/*.log") == "Deleted 1 files."
+    assert fs.delete_glob("*.md") == "No files matched."
+    with pytest.raises(ValueError):
+        fs.delete_glob("../*.log")
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+def test_special_files_are_not_read(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    os.mkfifo(tmp_path / "p")
+    fs.create_folder("d")
+    for path in ("p", "d"):
+        with pytest.raises(ValueError, match="does not exist"):
+            fs.read_file(path)
+        with pytest.raises(ValueError, match="does not exist"):
+            fs.copy_file(path, "copy")
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs os.symlink")
+def test_create_folders_sequence_does_not_follow_leaf_symlinks(tmp_path: Path):
+    sandbox, outside = tmp_path / "sb", tmp_path / "outside"
+    outside.mkdir()
+    fs = FileSandbox(sandbox)
+    fs.create_folder("d1")
+    os.symlink(outside, sandbox / "d2")
+    os.symlink(tmp_path / "nowhere", sandbox / "d3")
+    out = fs.create_folders_sequence("d", start=1, end=4)
+    assert out.startswith("Created:\nd4\n")
+    assert "Skipped (already existed):\nd1\nd2\nd3" in out
+    assert not (tmp_path / "nowhere").exists()
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs os.symlink")
+def test_bulk_rename_regex_skips_non_regular_entries(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.create_file("img_a.jpg")
+    os.symlink(tmp_path / "nowhere", tmp_path / "img_l")
+    for include_subdirs in (True, False):
+        out = fs.bulk_rename_regex(".", r"^img_", "x_", include_subdirs=include_subdirs, test_only=True)
+        assert out == "Preview (no changes):\nimg_a.jpg -> x_a.jpg"
+
+def test_copy_falls_back_when_in_kernel_copy_returns_zero(tmp_path: Path, monkeypatch):
+    # FUSE/vboxsf-style mounts report 0 from copy_file_range/sendfile without copying
+    for name in ("copy_file_range", "sendfile"):
+        if hasattr(os, name):
+            monkeypatch.setattr(os, name, lambda *args: 0)
+    fs = FileSandbox(tmp_path)
+    fs.write_file("a.txt", "payload")
+    fs.copy_file("a.txt", "b.txt")
+    assert fs.read_file("b.txt") == "payload"
+    fs.create_file("empty.txt")
+    fs.copy_file("empty.txt", "empty2.txt")
+    assert fs.read_file("empty2.txt") == ""
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs os.symlink")
+def test_listings_show_symlink_targets(tmp_path: Path):
+    fs = FileSandbox(tmp_path)
+    fs.write_file("logs/big.log", "x" * 5000)
+    os.symlink(tmp_path / "logs" / "big.log", tmp_path / "latest.log")
+    os.symlink(tmp_path / "logs", tmp_path / "ln")
+    os.symlink(tmp_path / "nowhere", tmp_path / "broken")
+    tree = fs.list_dir(".", max_depth=3)
+    assert "latest.log (5 KB)" in tree
+    assert "ln/ (link)" in tree
+    assert "broken (?)" in tree
+    assert tree.count("big.log") == 1  # the folder link is not expanded
+    assert fs.list_dir(".", tree=False).split("\n") == [
+        "ln/\t-", "logs/\t-", "broken\t?", "latest.log\t5 KB",
+    ]